@@ -5,24 +5,59 @@
 支持环境变量：NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
 """
 
+import functools
+import hashlib
+import json
 import os
+import pickle
+import re
 from neo4j import GraphDatabase
-import jieba
 import logging
+
+try:
+    import jieba_fast as jieba  # C 扩展加速版，API 与 jieba 完全一致
+except ImportError:
+    import jieba
 from typing import List, Optional
 
+try:
+    import ahocorasick  # pyahocorasick，C 扩展的多模式匹配
+except ImportError:
+    ahocorasick = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 问题类型关键词映射，编译成一条正则交替式，一次扫描即可归类
+KEYWORD_TO_TYPE = {
+    "象征": "symbol", "寓意": "symbol", "代表": "symbol", "含义": "symbol", "文化": "symbol",
+    "药用": "medicinal", "功效": "medicinal", "药效": "medicinal", "治疗": "medicinal", "治病": "medicinal",
+    "分布": "distribution", "哪里": "distribution", "在哪": "distribution", "产地": "distribution", "生长": "distribution",
+    "民俗": "folk", "用途": "folk", "使用": "folk", "怎么用": "folk",
+    "节日": "festival", "端午": "festival", "春节": "festival", "重阳": "festival", "中秋": "festival", "清明": "festival",
+    "文献": "literature", "记载": "literature", "诗经": "literature", "楚辞": "literature", "诗词": "literature",
+    "科": "taxonomy", "属": "taxonomy", "分类": "taxonomy",
+}
+_QTYPE_RE = re.compile("|".join(re.escape(k) for k in KEYWORD_TO_TYPE))
+# 类别优先级沿用原 if/elif 链的顺序（KEYWORD_TO_TYPE 即按此分组），
+# 多个类别的关键词同时命中时取优先级最高者，而不是位置最靠前者
+_TYPE_RANK = {t: i for i, t in enumerate(dict.fromkeys(KEYWORD_TO_TYPE.values()))}
+
+# 别名映射表：俗称 → 知识库标准名
+ALIAS_MAP = {
+    "菊花": "菊", "梅花": "梅", "兰花": "兰", "竹子": "竹",
+    "荷花": "荷", "莲花": "荷", "桂花": "桂", "牡丹花": "牡丹",
+    "杜鹃花": "杜鹃", "水仙花": "水仙", "艾草": "艾", "菖蒲叶": "菖蒲",
+    "松树": "松", "柏树": "柏", "柳树": "柳", "桑树": "桑",
+    "茶树": "茶", "桃树": "桃", "银杏树": "银杏", "梧桐树": "梧桐"
+}
+
 class PlantQASystem:
-    # ========== 类属性：别名映射表 ==========
-    ALIAS_MAP = {
-        "菊花": "菊", "梅花": "梅", "兰花": "兰", "竹子": "竹",
-        "荷花": "荷", "莲花": "荷", "桂花": "桂", "牡丹花": "牡丹",
-        "杜鹃花": "杜鹃", "水仙花": "水仙", "艾草": "艾", "菖蒲叶": "菖蒲",
-        "松树": "松", "柏树": "柏", "柳树": "柳", "桑树": "桑",
-        "茶树": "茶", "桃树": "桃", "银杏树": "银杏", "梧桐树": "梧桐"
-    }
+    # 本地缓存目录（自动机序列化等），避免每次启动重复构建
+    CACHE_DIR = ".cache"
+
+    # 保留类属性引用，旧调用方仍可用 PlantQASystem.ALIAS_MAP 访问
+    ALIAS_MAP = ALIAS_MAP
 
     def __init__(self, uri: str = None, user: str = None, password: str = None):
         """
@@ -35,13 +70,76 @@ class PlantQASystem:
         
         self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
         self.plant_names = self._get_all_plants()
+        self._plant_set = frozenset(self.plant_names)  # O(1) 成员判断
+        # 别名有效性在初始化时判定一次，问答路径不再逐次查集合
+        self._valid_aliases = {a: r for a, r in ALIAS_MAP.items() if r in self._plant_set}
+        self._ac = self._build_automaton()
+        # 相同问题直接命中缓存，省掉整条 Bolt 往返（绑定实例，避免 lru_cache 持有类级 self）
+        self._answer_cached = functools.lru_cache(maxsize=1024)(self._answer_uncached)
         self._setup_jieba()
         logger.info(f"✅ 完整问答系统已启动，连接至 {self.uri}，包含 {len(self.plant_names)} 种植物")
 
     def _get_all_plants(self) -> List[str]:
+        """获取全部植物名
+
+        列表缓存到磁盘，重启时只发一个 count 探针（索引计数，近乎零开销），
+        数量没变就跳过全量标签扫描。
+        """
+        cache_path = os.path.join(self.CACHE_DIR, "plants.json")
+        cached = None
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding='utf-8') as f:
+                    cached = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 植物列表缓存读取失败: {e}")
+
         with self.driver.session() as session:
-            result = session.run("MATCH (p:Plant) RETURN p.name as name ORDER BY p.name")
-            return [record['name'] for record in result]
+            count = session.execute_read(
+                lambda tx: tx.run("MATCH (p:Plant) RETURN count(p) as c").single()['c'])
+            if cached is not None and len(cached) == count:
+                return cached
+            names = session.execute_read(lambda tx: [
+                record['name'] for record in
+                tx.run("MATCH (p:Plant) RETURN p.name as name ORDER BY p.name")])
+
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(names, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"⚠️ 植物列表缓存写入失败: {e}")
+        return names
+
+    def _build_automaton(self):
+        """把植物名和别名编进一个 Aho–Corasick 自动机，问题只需线性扫描一次
+
+        构建结果按词表哈希序列化到 CACHE_DIR，词表没变的进程重启直接加载。
+        """
+        if ahocorasick is None:
+            return None
+        words = sorted(self.plant_names) + sorted(self.ALIAS_MAP)
+        key = hashlib.md5("\n".join(words).encode('utf-8')).hexdigest()
+        cache_path = os.path.join(self.CACHE_DIR, f"plant_ac_{key}.bin")
+        if os.path.exists(cache_path):
+            try:
+                return ahocorasick.load(cache_path, pickle.loads)
+            except Exception as e:
+                logger.warning(f"⚠️ 自动机缓存加载失败，重新构建: {e}")
+
+        ac = ahocorasick.Automaton()
+        for name in self.plant_names:
+            ac.add_word(name, ('plant', name, name))
+        for alias in ALIAS_MAP:
+            # 无效别名的解析结果直接编成 None，匹配后无需再查集合
+            ac.add_word(alias, ('alias', alias, self._valid_aliases.get(alias)))
+        ac.make_automaton()
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            ac.save(cache_path, pickle.dumps)
+        except OSError as e:
+            logger.warning(f"⚠️ 自动机缓存写入失败: {e}")
+        return ac
 
     def _setup_jieba(self):
         # 添加植物名称
@@ -61,180 +159,177 @@ class PlantQASystem:
     # 核心方法：回答问题
     # ------------------------------------------------------------
     def answer(self, question: str) -> str:
-        """主回答函数，自动识别植物并分派到具体查询"""
-        # 1. 直接匹配知识库中的植物名
-        for plant in self.plant_names:
-            if plant in question:
-                return self._answer_for_plant(plant, question)
-
-        # 2. 通过别名映射识别（使用类属性）
-        for alias, real_name in self.ALIAS_MAP.items():
-            if alias in question:
-                if real_name in self.plant_names:
-                    return self._answer_for_plant(real_name, question)
-                else:
+        """主回答函数，结果按问题字符串缓存"""
+        return self._answer_cached(question)
+
+    def clear_cache(self):
+        """数据更新后手动清空问答缓存"""
+        self._answer_cached.cache_clear()
+
+    def _answer_uncached(self, question: str) -> str:
+        """自动识别植物并分派到具体查询；整个问题只占用一个会话"""
+        with self.driver.session() as session:
+            if self._ac is not None:
+                # 1/2. 自动机单次扫描同时识别植物名和别名（植物名优先）
+                alias_hit = None
+                for _, (kind, word, real_name) in self._ac.iter(question):
+                    if kind == 'plant':
+                        return self._answer_for_plant(session, word, question)
+                    if alias_hit is None:
+                        alias_hit = (word, real_name)
+                if alias_hit:
+                    alias, real_name = alias_hit
+                    if real_name is not None:
+                        return self._answer_for_plant(session, real_name, question)
                     return f"❌ 暂未收录该种植物（{alias}）"
+            else:
+                # 1. 直接匹配知识库中的植物名
+                for plant in self.plant_names:
+                    if plant in question:
+                        return self._answer_for_plant(session, plant, question)
+
+                # 2. 通过别名映射识别
+                for alias in ALIAS_MAP:
+                    if alias in question:
+                        real_name = self._valid_aliases.get(alias)
+                        if real_name is not None:
+                            return self._answer_for_plant(session, real_name, question)
+                        else:
+                            return f"❌ 暂未收录该种植物（{alias}）"
 
-        # 3. 分词尝试提取（兜底）
-        words = jieba.lcut(question)
-        for word in words:
-            if word in self.plant_names:
-                return self._answer_for_plant(word, question)
+            # 3. 分词尝试提取（兜底）
+            words = jieba.lcut(question)
+            for word in words:
+                if word in self._plant_set:
+                    return self._answer_for_plant(session, word, question)
 
-        # 4. 完全没有识别出任何植物
-        return self._handle_general_question(question)
+            # 4. 完全没有识别出任何植物
+            return self._handle_general_question(session, question)
 
-    def _answer_for_plant(self, plant: str, question: str) -> str:
-        """给定植物名，根据问题类型返回对应信息"""
+    def _answer_for_plant(self, session, plant: str, question: str) -> str:
+        """给定植物名，根据问题类型分派到只读事务函数
+
+        execute_read 会把事务标记为只读，集群部署下可路由到从节点。
+        """
         q_type = self._identify_question_type(question)
-        with self.driver.session() as session:
-            if q_type == "symbol":
-                return self._query_symbol(session, plant)
-            elif q_type == "medicinal":
-                return self._query_medicinal(session, plant)
-            elif q_type == "distribution":
-                return self._query_distribution(session, plant)
-            elif q_type == "folk":
-                return self._query_folk(session, plant)
-            elif q_type == "festival":
-                return self._query_festival(session, plant)
-            elif q_type == "literature":
-                return self._query_literature(session, plant)
-            elif q_type == "taxonomy":
-                return self._query_taxonomy(session, plant)
-            else:
-                return self._query_basic(session, plant)
+        if q_type == "symbol":
+            return session.execute_read(self._query_symbol, plant)
+        elif q_type == "medicinal":
+            return session.execute_read(self._query_medicinal, plant)
+        elif q_type == "distribution":
+            return session.execute_read(self._query_distribution, plant)
+        elif q_type == "folk":
+            return session.execute_read(self._query_folk, plant)
+        elif q_type == "festival":
+            return session.execute_read(self._query_festival, plant)
+        elif q_type == "literature":
+            return session.execute_read(self._query_literature, plant)
+        elif q_type == "taxonomy":
+            return session.execute_read(self._query_taxonomy, plant)
+        else:
+            return session.execute_read(self._query_basic, plant)
 
     # ------------------------------------------------------------
     # 问题类型识别
     # ------------------------------------------------------------
     def _identify_question_type(self, question: str) -> str:
         q = question.lower()
-        if any(k in q for k in ["象征", "寓意", "代表", "含义", "文化"]):
-            return "symbol"
-        elif any(k in q for k in ["药用", "功效", "药效", "治疗", "治病"]):
-            return "medicinal"
-        elif any(k in q for k in ["分布", "哪里", "在哪", "产地", "生长"]):
-            return "distribution"
-        elif any(k in q for k in ["民俗", "用途", "使用", "怎么用"]):
-            return "folk"
-        elif any(k in q for k in ["节日", "端午", "春节", "重阳", "中秋", "清明"]):
-            return "festival"
-        elif any(k in q for k in ["文献", "记载", "诗经", "楚辞", "诗词"]):
-            return "literature"
-        elif any(k in q for k in ["科", "属", "分类"]):
-            return "taxonomy"
-        else:
-            return "basic"
+        return min((KEYWORD_TO_TYPE[m.group(0)] for m in _QTYPE_RE.finditer(q)),
+                   key=_TYPE_RANK.__getitem__, default="basic")
 
     # ------------------------------------------------------------
     # 具体查询方法（每个方法返回可直接显示的字符串）
     # ------------------------------------------------------------
-    def _query_symbol(self, session, plant: str) -> str:
-        result = session.run("""
-            MATCH (p:Plant {name: $name})-[:HAS_SYMBOL]->(s:Symbol)
-            RETURN collect(s.meaning) as symbols
+    def _query_symbol(self, tx, plant: str) -> str:
+        # 关系查询与平铺属性回退合并成一条语句，避免二次往返
+        result = tx.run("""
+            MATCH (p:Plant {name: $name})
+            OPTIONAL MATCH (p)-[:HAS_SYMBOL]->(s:Symbol)
+            RETURN collect(s.meaning) as symbols, p.cultural_symbol as symbol
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['symbols']:
             return f"🌿 {plant}的文化象征：\n" + "、".join(record['symbols'])
-        result = session.run("""
-            MATCH (p:Plant {name: $name})
-            RETURN p.cultural_symbol as symbol
-        """, name=plant)
-        record = result.single()
         if record and record['symbol']:
             return f"🌿 {plant}的文化象征：\n{record['symbol']}"
         return f"🌿 {plant}的文化象征信息暂缺。"
 
-    def _query_medicinal(self, session, plant: str) -> str:
-        result = session.run("""
-            MATCH (p:Plant {name: $name})-[:HAS_MEDICINAL]->(m:Medicinal)
-            RETURN collect(m.effect) as effects
+    def _query_medicinal(self, tx, plant: str) -> str:
+        result = tx.run("""
+            MATCH (p:Plant {name: $name})
+            OPTIONAL MATCH (p)-[:HAS_MEDICINAL]->(m:Medicinal)
+            RETURN collect(m.effect) as effects, p.medicinal_value as med
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['effects']:
             return f"💊 {plant}的药用价值：\n" + "、".join(record['effects'])
-        result = session.run("""
-            MATCH (p:Plant {name: $name})
-            RETURN p.medicinal_value as med
-        """, name=plant)
-        record = result.single()
         if record and record['med'] and record['med'] != '无药用记载':
             return f"💊 {plant}的药用价值：\n{record['med']}"
         return f"💊 {plant}的药用价值信息暂缺。"
 
-    def _query_distribution(self, session, plant: str) -> str:
-        result = session.run("""
+    def _query_distribution(self, tx, plant: str) -> str:
+        result = tx.run("""
             MATCH (p:Plant {name: $name})
             RETURN p.distribution as dist
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['dist']:
             return f"🗺️ {plant}的分布区域：\n{record['dist']}"
         return f"🗺️ {plant}的分布信息暂缺。"
 
-    def _query_folk(self, session, plant: str) -> str:
-        result = session.run("""
+    def _query_folk(self, tx, plant: str) -> str:
+        result = tx.run("""
             MATCH (p:Plant {name: $name})
             RETURN p.folk_use as folk
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['folk']:
             return f"🏮 {plant}的民俗用途：\n{record['folk']}"
         return f"🏮 {plant}的民俗用途信息暂缺。"
 
-    def _query_festival(self, session, plant: str) -> str:
-        result = session.run("""
-            MATCH (p:Plant {name: $name})-[:RELATED_TO_FESTIVAL]->(f:Festival)
-            RETURN collect(f.name) as festivals
+    def _query_festival(self, tx, plant: str) -> str:
+        result = tx.run("""
+            MATCH (p:Plant {name: $name})
+            OPTIONAL MATCH (p)-[:RELATED_TO_FESTIVAL]->(f:Festival)
+            RETURN collect(f.name) as festivals, p.festival as festival
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['festivals']:
             return f"🎉 {plant}相关的节日：\n" + "、".join(record['festivals'])
-        result = session.run("""
-            MATCH (p:Plant {name: $name})
-            RETURN p.festival as festival
-        """, name=plant)
-        record = result.single()
         if record and record['festival']:
             return f"🎉 {plant}相关的节日：\n{record['festival']}"
         return f"🎉 {plant}的节日信息暂缺。"
 
-    def _query_literature(self, session, plant: str) -> str:
-        result = session.run("""
-            MATCH (p:Plant {name: $name})-[:RECORDED_IN]->(l:Literature)
-            RETURN collect(l.name) as literatures
+    def _query_literature(self, tx, plant: str) -> str:
+        result = tx.run("""
+            MATCH (p:Plant {name: $name})
+            OPTIONAL MATCH (p)-[:RECORDED_IN]->(l:Literature)
+            RETURN collect(l.name) as literatures, p.literature_source as lit
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record and record['literatures']:
             return f"📖 {plant}的文献记载：\n" + "、".join(record['literatures'])
-        result = session.run("""
-            MATCH (p:Plant {name: $name})
-            RETURN p.literature_source as lit
-        """, name=plant)
-        record = result.single()
         if record and record['lit']:
             return f"📖 {plant}的文献出处：\n{record['lit']}"
         return f"📖 {plant}的文献信息暂缺。"
 
-    def _query_taxonomy(self, session, plant: str) -> str:
-        result = session.run("""
+    def _query_taxonomy(self, tx, plant: str) -> str:
+        result = tx.run("""
             MATCH (p:Plant {name: $name})
             RETURN p.latin_name as latin, p.family as family, p.genus as genus
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record:
             return f"🌱 {plant}（{record['latin']}）\n🏷️ 科：{record['family']}  属：{record['genus']}"
         return f"🌱 {plant}的科属信息暂缺。"
 
-    def _query_basic(self, session, plant: str) -> str:
-        result = session.run("""
+    def _query_basic(self, tx, plant: str) -> str:
+        result = tx.run("""
             MATCH (p:Plant {name: $name})
             RETURN p.latin_name as latin, p.family as family, p.genus as genus,
                    p.distribution as dist, p.cultural_symbol as symbol
         """, name=plant)
-        record = result.single()
+        record = next(iter(result), None)
         if record:
             info = f"🌿 {plant}（{record['latin']}）\n"
             info += f"🏷️ 科：{record['family']}  属：{record['genus']}\n"
@@ -248,23 +343,21 @@ class PlantQASystem:
     # ------------------------------------------------------------
     # 通用问题（不包含具体植物）
     # ------------------------------------------------------------
-    def _handle_general_question(self, question: str) -> str:
+    def _handle_general_question(self, session, question: str) -> str:
         q = question.lower()
         if any(k in q for k in ["所有植物", "有哪些植物", "植物列表"]):
             plants_str = "、".join(self.plant_names)
             return f"📚 知识库中共有 {len(self.plant_names)} 种植物：\n{plants_str}"
         elif "端午" in q:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (p:Plant)-[:RELATED_TO_FESTIVAL]->(f:Festival)
-                    WHERE f.name CONTAINS '端午'
-                    RETURN p.name as name
-                """)
-                plants = [r['name'] for r in result]
-                if plants:
-                    return f"🎋 端午节相关植物：{ '、'.join(plants) }"
-                else:
-                    return "🎋 端午节相关植物：艾、菖蒲、蒜"
+            plants = session.execute_read(lambda tx: [r['name'] for r in tx.run("""
+                MATCH (p:Plant)-[:RELATED_TO_FESTIVAL]->(f:Festival)
+                WHERE f.name CONTAINS '端午'
+                RETURN p.name as name
+            """)])
+            if plants:
+                return f"🎋 端午节相关植物：{ '、'.join(plants) }"
+            else:
+                return "🎋 端午节相关植物：艾、菖蒲、蒜"
         elif "春节" in q:
             return "🧧 春节相关植物：橘、桃、水仙"
         elif "重阳" in q:
@@ -274,60 +367,85 @@ class PlantQASystem:
         elif "清明" in q:
             return "🌧️ 清明节相关植物：柳、杜鹃、柏"
         elif "楚辞" in q or "诗经" in q:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (p:Plant)-[:RECORDED_IN]->(l:Literature)
-                    WHERE l.name CONTAINS '楚辞' OR l.name CONTAINS '诗经'
-                    RETURN p.name as name
-                """)
-                plants = [r['name'] for r in result]
-                if plants:
-                    return f"📜 《楚辞》《诗经》中记载的植物：{ '、'.join(plants[:10]) }……"
+            plants = session.execute_read(lambda tx: [r['name'] for r in tx.run("""
+                MATCH (p:Plant)-[:RECORDED_IN]->(l:Literature)
+                WHERE l.name CONTAINS '楚辞' OR l.name CONTAINS '诗经'
+                RETURN p.name as name
+            """)])
+            if plants:
+                return f"📜 《楚辞》《诗经》中记载的植物：{ '、'.join(plants[:10]) }……"
         return "❓ 请明确指定植物名称（如：兰有什么文化象征？）"
 
     # ------------------------------------------------------------
     # 对外接口：获取植物的完整详细信息（用于侧边栏展示）
     # ------------------------------------------------------------
-    def get_plant_detail(self, plant_name: str) -> dict:
+    _DETAIL_QUERY = """
+        UNWIND $names AS n
+        MATCH (p:Plant {name: n})
+        OPTIONAL MATCH (p)-[:HAS_SYMBOL]->(s:Symbol)
+        OPTIONAL MATCH (p)-[:HAS_MEDICINAL]->(m:Medicinal)
+        OPTIONAL MATCH (p)-[:RECORDED_IN]->(l:Literature)
+        OPTIONAL MATCH (p)-[:RELATED_TO_FESTIVAL]->(f:Festival)
+        RETURN p.name as name,
+               p.latin_name as latin_name,
+               p.family as family,
+               p.genus as genus,
+               p.distribution as distribution,
+               p.folk_use as folk_use,
+               p.ecological_meaning as ecological,
+               p.cultural_symbol as cultural_symbol,
+               collect(DISTINCT s.meaning) as symbols,
+               collect(DISTINCT m.effect) as medicinal,
+               collect(DISTINCT l.name) as literature,
+               collect(DISTINCT f.name) as festivals
+    """
+
+    @staticmethod
+    def _build_detail(record) -> dict:
+        detail = {
+            "name": record["name"],
+            "latin": record["latin_name"],
+            "family": record["family"],
+            "genus": record["genus"],
+            "distribution": record["distribution"] or "暂无分布信息",
+            "folk_use": record["folk_use"] or "暂无民俗用途",
+            "ecological": record["ecological"] or "暂无生态意义",
+            "cultural_symbol": record["cultural_symbol"] or "暂无文化象征",
+            "symbols": record["symbols"],
+            "medicinal": record["medicinal"],
+            "literature": record["literature"],
+            "festivals": record["festivals"]
+        }
+        # 顿号串在这里拼好一次，展示层直接取用，免去每次渲染的 join
+        detail["symbols_joined"] = "、".join(detail["symbols"])
+        detail["medicinal_joined"] = "、".join(detail["medicinal"])
+        detail["literature_joined"] = "、".join(detail["literature"])
+        detail["festivals_joined"] = "、".join(detail["festivals"])
+        return detail
+
+    def get_plant_details(self, plant_names: List[str]) -> dict:
+        """批量获取多个植物的详细信息，一次查询返回 {植物名: 详情} 映射"""
         with self.driver.session() as session:
-            result = session.run("""
-                MATCH (p:Plant {name: $name})
-                OPTIONAL MATCH (p)-[:HAS_SYMBOL]->(s:Symbol)
-                OPTIONAL MATCH (p)-[:HAS_MEDICINAL]->(m:Medicinal)
-                OPTIONAL MATCH (p)-[:RECORDED_IN]->(l:Literature)
-                OPTIONAL MATCH (p)-[:RELATED_TO_FESTIVAL]->(f:Festival)
-                RETURN p.name as name,
-                       p.latin_name as latin_name,
-                       p.family as family,
-                       p.genus as genus,
-                       p.distribution as distribution,
-                       p.folk_use as folk_use,
-                       p.ecological_meaning as ecological,
-                       p.cultural_symbol as cultural_symbol,
-                       collect(DISTINCT s.meaning) as symbols,
-                       collect(DISTINCT m.effect) as medicinal,
-                       collect(DISTINCT l.name) as literature,
-                       collect(DISTINCT f.name) as festivals
-            """, name=plant_name)
-            record = result.single()
-            if record:
-                return {
-                    "name": record["name"],
-                    "latin": record["latin_name"],
-                    "family": record["family"],
-                    "genus": record["genus"],
-                    "distribution": record["distribution"] or "暂无分布信息",
-                    "folk_use": record["folk_use"] or "暂无民俗用途",
-                    "ecological": record["ecological"] or "暂无生态意义",
-                    "cultural_symbol": record["cultural_symbol"] or "暂无文化象征",
-                    "symbols": record["symbols"],
-                    "medicinal": record["medicinal"],
-                    "literature": record["literature"],
-                    "festivals": record["festivals"]
-                }
-            return None
+            result = session.run(self._DETAIL_QUERY, names=plant_names)
+            return {record["name"]: self._build_detail(record) for record in result}
+
+    async def get_plant_details_async(self, plant_names: List[str]) -> dict:
+        """get_plant_details 的异步版本，预取场景下不阻塞调用方的事件循环"""
+        from neo4j import AsyncGraphDatabase
+        driver = AsyncGraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        try:
+            async with driver.session() as session:
+                result = await session.run(self._DETAIL_QUERY, names=plant_names)
+                return {record["name"]: self._build_detail(record)
+                        async for record in result}
+        finally:
+            await driver.close()
+
+    def get_plant_detail(self, plant_name: str) -> Optional[dict]:
+        return self.get_plant_details([plant_name]).get(plant_name)
 
     def close(self):
+        self.clear_cache()
         self.driver.close()
 
 
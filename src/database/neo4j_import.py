@@ -37,9 +37,15 @@ class Neo4jDataImporter:
         logger.info("✅ 数据库已清空")
     
     def create_constraints(self):
+        # 唯一约束自带索引，MERGE 时走索引查找而不是全标签扫描
         constraints = [
             "CREATE CONSTRAINT plant_id_unique IF NOT EXISTS FOR (p:Plant) REQUIRE p.id IS UNIQUE",
             "CREATE CONSTRAINT plant_name_unique IF NOT EXISTS FOR (p:Plant) REQUIRE p.name IS UNIQUE",
+            "CREATE CONSTRAINT family_name_unique IF NOT EXISTS FOR (f:Family) REQUIRE f.name IS UNIQUE",
+            "CREATE CONSTRAINT symbol_meaning_unique IF NOT EXISTS FOR (s:Symbol) REQUIRE s.meaning IS UNIQUE",
+            "CREATE CONSTRAINT medicinal_effect_unique IF NOT EXISTS FOR (m:Medicinal) REQUIRE m.effect IS UNIQUE",
+            "CREATE CONSTRAINT literature_name_unique IF NOT EXISTS FOR (l:Literature) REQUIRE l.name IS UNIQUE",
+            "CREATE CONSTRAINT festival_name_unique IF NOT EXISTS FOR (f:Festival) REQUIRE f.name IS UNIQUE",
         ]
         with self.driver.session() as session:
             for c in constraints:
@@ -49,100 +55,156 @@ class Neo4jDataImporter:
                     logger.warning(f"约束可能已存在: {e}")
         logger.info("✅ 约束已创建")
     
+    # 每个事务最多写入的行数，行数多时分段提交避免单事务过大
+    BATCH_SIZE = 1000
+
     def import_data(self, excel_path):
-        # 读取 Excel，跳过前5行标题
-        df = pd.read_excel(excel_path, header=5)
+        # 读取 Excel，跳过前5行标题；优先用 Rust 实现的 calamine 引擎解析
+        try:
+            df = pd.read_excel(excel_path, header=5, engine='calamine')
+        except ImportError:
+            df = pd.read_excel(excel_path, header=5)
         df = df.dropna(subset=['植物中文名']).fillna('')
         logger.info(f"📊 读取到 {len(df)} 条植物数据")
-        
+
+        # 先在 Python 侧整理好批量参数，再用 UNWIND 一次性写入，
+        # 每种节点/关系只发一条 Cypher，避免逐行提交的网络往返；
+        # 多值字段先用向量化的 .str.split 一次拆好（C 循环），循环里只读现成列表
+        df['_symbols'] = df['文化象征'].astype(str).str.split('；')
+        df['_medicinals'] = df['药用价值'].astype(str).str.replace('；', ',').str.split(',')
+        df['_festivals'] = df['节日'].astype(str).str.split('；')
+
+        # 整批放进一个显式写事务，让 Neo4j 合并 WAL 刷盘。
+        # itertuples 直接产出普通元组，不像 iterrows/to_dict 那样逐行装箱 Series
+        cols = list(df.columns)
+        records = [dict(zip(cols, row)) for row in df.itertuples(index=False, name=None)]
         with self.driver.session() as session:
-            for index, row in df.iterrows():
-                try:
-                    # 创建植物节点
-                    session.run("""
-                        CREATE (p:Plant {
-                            id: $id,
-                            name: $name,
-                            latin_name: $latin_name,
-                            family: $family,
-                            genus: $genus,
-                            distribution: $distribution,
-                            folk_use: $folk_use,
-                            ecological_meaning: $ecological_meaning,
-                            cultural_symbol: $cultural_symbol,
-                            medicinal_value: $medicinal_value,
-                            literature_source: $literature_source,
-                            festival: $festival
-                        })
-                    """,
-                    id=row['ID'],
-                    name=row['植物中文名'],
-                    latin_name=row['植物拉丁学名'],
-                    family=row['植物科名'],
-                    genus=row['植物属名'],
-                    distribution=row['现代地理分布'],
-                    folk_use=row['民俗用途'],
-                    ecological_meaning=row['生态意义'],
-                    cultural_symbol=row['文化象征'],
-                    medicinal_value=row['药用价值'],
-                    literature_source=row['文献出处'],
-                    festival=row['节日'])
-                    
-                    # 创建科关系
-                    if row['植物科名']:
-                        session.run("""
-                            MATCH (p:Plant {name: $name})
-                            MERGE (f:Family {name: $family})
-                            MERGE (p)-[:BELONGS_TO_FAMILY]->(f)
-                        """, name=row['植物中文名'], family=row['植物科名'])
-                    
-                    # 创建象征意义关系
-                    if row['文化象征']:
-                        symbols = str(row['文化象征']).split('；')
-                        for sym in symbols:
-                            if sym.strip():
-                                session.run("""
-                                    MATCH (p:Plant {name: $name})
-                                    MERGE (s:Symbol {meaning: $sym})
-                                    MERGE (p)-[:HAS_SYMBOL]->(s)
-                                """, name=row['植物中文名'], sym=sym.strip())
-                    
-                    # 创建药用价值关系
-                    if row['药用价值'] and row['药用价值'] != '无药用记载':
-                        medicines = str(row['药用价值']).replace('；', ',').split(',')
-                        for med in medicines:
-                            if med.strip():
-                                session.run("""
-                                    MATCH (p:Plant {name: $name})
-                                    MERGE (m:Medicinal {effect: $med})
-                                    MERGE (p)-[:HAS_MEDICINAL]->(m)
-                                """, name=row['植物中文名'], med=med.strip())
-                    
-                    # 创建文献关系
-                    if row['文献出处']:
-                        session.run("""
-                            MATCH (p:Plant {name: $name})
-                            MERGE (l:Literature {name: $lit})
-                            MERGE (p)-[:RECORDED_IN]->(l)
-                        """, name=row['植物中文名'], lit=row['文献出处'])
-                    
-                    # 创建节日关系
-                    if row['节日']:
-                        festivals = str(row['节日']).split('；')
-                        for f in festivals:
-                            if f.strip():
-                                session.run("""
-                                    MATCH (p:Plant {name: $name})
-                                    MERGE (f:Festival {name: $fest})
-                                    MERGE (p)-[:RELATED_TO_FESTIVAL]->(f)
-                                """, name=row['植物中文名'], fest=f.strip())
-                    
-                    logger.info(f"✅ 已导入: {row['植物中文名']} ({index+1}/{len(df)})")
-                    
-                except Exception as e:
-                    logger.error(f"❌ 导入失败 {row.get('植物中文名', '未知')}: {e}")
-        
+            for start in range(0, len(records), self.BATCH_SIZE):
+                chunk = records[start:start + self.BATCH_SIZE]
+                session.execute_write(self._bulk_load, self._build_payload(chunk))
+
         logger.info("🎉 数据导入完成！")
+
+    @staticmethod
+    def _build_payload(records):
+        """把若干行 Excel 记录整理成各 UNWIND 语句的参数列表"""
+        rows = []
+        family_pairs = []
+        symbol_pairs = []
+        medicinal_pairs = []
+        literature_pairs = []
+        festival_pairs = []
+        for row in records:
+            name = row['植物中文名']
+            rows.append({
+                'id': row['ID'],
+                'name': name,
+                'latin_name': row['植物拉丁学名'],
+                'family': row['植物科名'],
+                'genus': row['植物属名'],
+                'distribution': row['现代地理分布'],
+                'folk_use': row['民俗用途'],
+                'ecological_meaning': row['生态意义'],
+                'cultural_symbol': row['文化象征'],
+                'medicinal_value': row['药用价值'],
+                'literature_source': row['文献出处'],
+                'festival': row['节日'],
+            })
+            if row['植物科名']:
+                family_pairs.append({'name': name, 'family': row['植物科名']})
+            if row['文化象征']:
+                for sym in row['_symbols']:
+                    if sym.strip():
+                        symbol_pairs.append({'name': name, 'sym': sym.strip()})
+            if row['药用价值'] and row['药用价值'] != '无药用记载':
+                for med in row['_medicinals']:
+                    if med.strip():
+                        medicinal_pairs.append({'name': name, 'med': med.strip()})
+            if row['文献出处']:
+                literature_pairs.append({'name': name, 'lit': row['文献出处']})
+            if row['节日']:
+                for fest in row['_festivals']:
+                    if fest.strip():
+                        festival_pairs.append({'name': name, 'fest': fest.strip()})
+
+        return {
+            'rows': rows,
+            'family_pairs': family_pairs,
+            'symbol_pairs': symbol_pairs,
+            'medicinal_pairs': medicinal_pairs,
+            'literature_pairs': literature_pairs,
+            'festival_pairs': festival_pairs,
+        }
+
+    @staticmethod
+    def _bulk_load(tx, payload):
+        """在一个写事务内执行六条 UNWIND 批量语句"""
+        # 创建植物节点
+        tx.run("""
+            UNWIND $rows AS r
+            CREATE (p:Plant {
+                id: r.id,
+                name: r.name,
+                latin_name: r.latin_name,
+                family: r.family,
+                genus: r.genus,
+                distribution: r.distribution,
+                folk_use: r.folk_use,
+                ecological_meaning: r.ecological_meaning,
+                cultural_symbol: r.cultural_symbol,
+                medicinal_value: r.medicinal_value,
+                literature_source: r.literature_source,
+                festival: r.festival
+            })
+        """, rows=payload['rows'])
+
+        # 创建科关系
+        tx.run("""
+            UNWIND $pairs AS x
+            MATCH (p:Plant {name: x.name})
+            MERGE (f:Family {name: x.family})
+            MERGE (p)-[:BELONGS_TO_FAMILY]->(f)
+        """, pairs=payload['family_pairs'])
+
+        # 创建象征意义关系
+        tx.run("""
+            UNWIND $pairs AS x
+            MATCH (p:Plant {name: x.name})
+            MERGE (s:Symbol {meaning: x.sym})
+            MERGE (p)-[:HAS_SYMBOL]->(s)
+        """, pairs=payload['symbol_pairs'])
+
+        # 创建药用价值关系
+        tx.run("""
+            UNWIND $pairs AS x
+            MATCH (p:Plant {name: x.name})
+            MERGE (m:Medicinal {effect: x.med})
+            MERGE (p)-[:HAS_MEDICINAL]->(m)
+        """, pairs=payload['medicinal_pairs'])
+
+        # 创建文献关系
+        tx.run("""
+            UNWIND $pairs AS x
+            MATCH (p:Plant {name: x.name})
+            MERGE (l:Literature {name: x.lit})
+            MERGE (p)-[:RECORDED_IN]->(l)
+        """, pairs=payload['literature_pairs'])
+
+        # 创建节日关系
+        tx.run("""
+            UNWIND $pairs AS x
+            MATCH (p:Plant {name: x.name})
+            MERGE (f:Festival {name: x.fest})
+            MERGE (p)-[:RELATED_TO_FESTIVAL]->(f)
+        """, pairs=payload['festival_pairs'])
+
+        # 每批只打一行日志，避免逐行 I/O
+        logger.info(
+            f"✅ 本批导入 {len(payload['rows'])} 个植物节点，"
+            f"关系：科 {len(payload['family_pairs'])}、象征 {len(payload['symbol_pairs'])}、"
+            f"药用 {len(payload['medicinal_pairs'])}、文献 {len(payload['literature_pairs'])}、"
+            f"节日 {len(payload['festival_pairs'])}"
+        )
     
     def get_statistics(self):
         stats = {}
@@ -158,9 +220,9 @@ class Neo4jDataImporter:
 
 def main():
     # ========== 云数据库连接信息（已填好，可直接使用） ==========
-   NEO4J_URI = "bolt://localhost:7687"
-   NEO4J_USER = "neo4j"
-   NEO4J_PASSWORD = "12345678"
+    NEO4J_URI = "bolt://localhost:7687"
+    NEO4J_USER = "neo4j"
+    NEO4J_PASSWORD = "12345678"
     
     # Excel 文件路径（相对于项目根目录）
     EXCEL_PATH = "data/荆楚植物文化图谱植物数据.xlsx"
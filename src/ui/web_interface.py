@@ -5,11 +5,13 @@
 纯Streamlit原生组件版，支持环境变量连接Neo4j
 """
 
+import asyncio
+import collections
+import hashlib
+import re
 import streamlit as st
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from api.free_qa_system import PlantQASystem
 
 # 页面配置
 st.set_page_config(
@@ -21,82 +23,136 @@ st.set_page_config(
 # 初始化问答系统（缓存，自动从环境变量读取）
 @st.cache_resource
 def init_qa():
-    return PlantQASystem()
+    # 延迟导入：neo4j 驱动等重依赖不在首屏渲染前加载，且缓存保证只导入一次
+    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+    from api.free_qa_system import PlantQASystem
+    qa = PlantQASystem()
+    # 确保常用查找字段有索引，点查走索引而不是全标签扫描；
+    # 数据库里已有等价约束/索引时语句会报错，直接忽略
+    index_statements = [
+        "CREATE INDEX plant_name_idx IF NOT EXISTS FOR (p:Plant) ON (p.name)",
+        "CREATE INDEX festival_name_idx IF NOT EXISTS FOR (f:Festival) ON (f.name)",
+        "CREATE INDEX symbol_meaning_idx IF NOT EXISTS FOR (s:Symbol) ON (s.meaning)",
+    ]
+    with qa.driver.session() as session:
+        for stmt in index_statements:
+            try:
+                # consume() 强制结果落地，服务端报错在 try 里抛出并被吞掉
+                session.run(stmt).consume()
+            except Exception:
+                pass
+    return qa
 
 qa = init_qa()
 
+# 植物名列表在模块层快照成不可变元组，每次重跑复用同一个对象
+PLANT_NAMES = tuple(qa.plant_names)
+
+# 启动时用一条 UNWIND 查询预取全部植物详情，侧边栏浏览不再逐个查库；
+# 走异步驱动执行，异步路径不可用时回退同步查询
+@st.cache_resource
+def load_all_details(_qa):
+    try:
+        return asyncio.run(_qa.get_plant_details_async(_qa.plant_names))
+    except Exception:
+        return _qa.get_plant_details(_qa.plant_names)
+
+# 详情的字段集合与列式（SoA）布局：整列连续存放，
+# 后续做批量筛选（如按节日找植物）可以直接对整列向量化
+DETAIL_FIELDS = (
+    "name", "latin", "family", "genus", "distribution", "folk_use",
+    "ecological", "cultural_symbol", "symbols", "medicinal",
+    "literature", "festivals", "symbols_joined", "medicinal_joined",
+    "literature_joined", "festivals_joined",
+)
+
+@st.cache_resource
+def build_details_soa(_qa):
+    details_list = list(load_all_details(_qa).values())
+    soa = {k: [d[k] for d in details_list] for k in DETAIL_FIELDS}
+    name_to_idx = {n: i for i, n in enumerate(soa["name"])}
+    return soa, name_to_idx
+
+details_soa, name_to_idx = build_details_soa(qa)
+
+# 详情卡片独立成 fragment：问答区交互不再重建它；
+# 选中植物没变时直接输出上次拼好的 Markdown
+@st.fragment
+def sidebar_detail(selected_plant):
+    if not selected_plant:
+        return
+    if st.session_state.get("_last_plant") != selected_plant:
+        idx = name_to_idx.get(selected_plant)
+        if idx is None:
+            st.session_state["_detail_md"] = ""
+        else:
+            detail = {k: details_soa[k][idx] for k in DETAIL_FIELDS}
+            # 详情卡片拼成一段 Markdown 一次性输出，
+            # 前端每次刷新只收 1 条消息而不是 ~16 条
+            parts = [
+                "---",
+                f"### 🌿 {detail['name']}",
+                f"*{detail['latin']}*",
+                f"**🏷️ 科属**\n\n{detail['family']} · {detail['genus']}",
+                f"**🗺️ 分布**\n\n{detail['distribution']}",
+                f"**✨ 文化象征**\n\n{detail['cultural_symbol']}",
+            ]
+            if detail['symbols_joined']:
+                parts.append("**🔖 详细象征**\n\n" + detail['symbols_joined'])
+            if detail['medicinal_joined']:
+                parts.append("**💊 药用价值**\n\n" + detail['medicinal_joined'])
+            if detail['folk_use'] and detail['folk_use'] != '暂无民俗用途':
+                parts.append(f"**🏮 民俗用途**\n\n{detail['folk_use']}")
+            if detail['festivals_joined']:
+                parts.append("**🎉 相关节日**\n\n" + detail['festivals_joined'])
+            if detail['literature_joined']:
+                parts.append("**📖 文献记载**\n\n" + detail['literature_joined'])
+            parts.append("---")
+            st.session_state["_detail_md"] = "\n\n".join(parts)
+        st.session_state["_last_plant"] = selected_plant
+    if st.session_state.get("_detail_md"):
+        st.markdown(st.session_state["_detail_md"])
+
+# 示例问题：(控件 key, 按钮文字[, 实际注入的问题，缺省同按钮文字])
+EXAMPLES = (
+    ("ex1", "兰有什么文化象征？"),
+    ("ex2", "端午节和什么植物有关？"),
+    ("ex3", "梅花分布在哪里？"),
+    ("ex4", "菊花的药用价值", "菊花的药用价值是什么？"),
+)
+
+# 回答里的哨兵子串决定提示组件，一次正则扫描代替逐个 in 判断
+_ROUTE = re.compile(r"(暂未收录)|(请明确指定)")
+_ROUTERS = (st.warning, st.info)
+
+# 问答结果缓存：示例按钮反复注入同样的问题，重复提问直接命中内存
+@st.cache_data(ttl=600, max_entries=512)
+def _cached_answer(q_norm: str) -> str:
+    return qa.answer(q_norm)
+
 # ------------------------------------------------------------
 # 侧边栏：植物列表 + 详情卡片（纯Streamlit组件，无手写HTML）
 # ------------------------------------------------------------
 with st.sidebar:
     st.image("https://img.icons8.com/color/96/000000/plant-under-sun.png", width=80)
     st.markdown("## 📚 植物知识库")
-    st.caption(f"共收录 {len(qa.plant_names)} 种荆楚地区植物")
-    
+    st.caption(f"共收录 {len(PLANT_NAMES)} 种荆楚地区植物")
+
     # 植物选择下拉框
     selected_plant = st.selectbox(
         "🌱 选择植物查看详情",
-        qa.plant_names,
+        PLANT_NAMES,
         index=0,
         key="plant_selector"
     )
     
-    if selected_plant:
-        detail = qa.get_plant_detail(selected_plant)
-        if detail:
-            st.markdown("---")
-            st.subheader(f"🌿 {detail['name']}")
-            st.caption(f"*{detail['latin']}*")
-            
-            # 科属
-            st.markdown("**🏷️ 科属**")
-            st.write(f"{detail['family']} · {detail['genus']}")
-            
-            # 分布
-            st.markdown("**🗺️ 分布**")
-            st.write(detail['distribution'])
-            
-            # 文化象征（简要）
-            st.markdown("**✨ 文化象征**")
-            st.write(detail['cultural_symbol'])
-            
-            # 详细象征（如果有）
-            if detail['symbols']:
-                st.markdown("**🔖 详细象征**")
-                st.write("、".join(detail['symbols']))
-            
-            # 药用价值
-            if detail['medicinal']:
-                st.markdown("**💊 药用价值**")
-                st.write("、".join(detail['medicinal']))
-            
-            # 民俗用途
-            if detail['folk_use'] and detail['folk_use'] != '暂无民俗用途':
-                st.markdown("**🏮 民俗用途**")
-                st.write(detail['folk_use'])
-            
-            # 相关节日
-            if detail['festivals']:
-                st.markdown("**🎉 相关节日**")
-                st.write("、".join(detail['festivals']))
-            
-            # 文献记载
-            if detail['literature']:
-                st.markdown("**📖 文献记载**")
-                st.write("、".join(detail['literature']))
-            
-            st.markdown("---")
-    
+    sidebar_detail(selected_plant)
+
     st.markdown("---")
     st.markdown("### 💡 试试这样问")
-    if st.button("兰有什么文化象征？", key="ex1"):
-        st.session_state.question = "兰有什么文化象征？"
-    if st.button("端午节和什么植物有关？", key="ex2"):
-        st.session_state.question = "端午节和什么植物有关？"
-    if st.button("梅花分布在哪里？", key="ex3"):
-        st.session_state.question = "梅花分布在哪里？"
-    if st.button("菊花的药用价值", key="ex4"):
-        st.session_state.question = "菊花的药用价值是什么？"
+    for key, label, *q in EXAMPLES:
+        if st.button(label, key=key):
+            st.session_state.question = q[0] if q else label
 
 # ------------------------------------------------------------
 # 主界面：问答区域
@@ -104,51 +160,73 @@ with st.sidebar:
 st.title("🌿 荆楚植物文化知识图谱问答系统")
 st.markdown("基于50种荆楚地区植物的文化、药用、民俗、分布等数据构建的智能问答系统。")
 
-# 输入框和提问按钮
-col1, col2 = st.columns([4, 1])
-with col1:
-    default_question = st.session_state.get("question", "")
-    question = st.text_input(
-        "💬 请输入您的问题：",
-        placeholder="例如：兰有什么文化象征？",
-        value=default_question,
-        label_visibility="collapsed"
-    )
-with col2:
-    ask_button = st.button("🚀 提问", type="primary", use_container_width=True)
+# 问答区域封装成 fragment：控件交互只重跑本段，不再整页重跑
+@st.fragment
+def qa_fragment():
+    # 输入框和提问按钮包在表单里：只有提交才触发重跑，逐键输入不再打扰后端
+    with st.form("qa_form", clear_on_submit=False):
+        # 输入框带固定 key，身份不随参数变化；示例问题 pop 一次、
+        # 写进控件自己的 session_state 条目完成注入
+        if "question" in st.session_state:
+            st.session_state.qa_input = st.session_state.pop("question")
+        question = st.text_input(
+            "💬 请输入您的问题：",
+            placeholder="例如：兰有什么文化象征？",
+            key="qa_input",
+            label_visibility="collapsed"
+        )
+        ask_button = st.form_submit_button("🚀 提问", type="primary")
 
-# 处理提问
-if ask_button and question:
-    with st.spinner("🔍 正在查询知识图谱..."):
-        answer = qa.answer(question)
-    
-    st.markdown("### 📝 回答")
-    if "暂未收录" in answer:
-        st.warning(answer)
-    elif "请明确指定" in answer:
-        st.info(answer)
-    else:
-        st.success(answer)
-    
-    # 保存到历史记录
-    if "history" not in st.session_state:
-        st.session_state.history = []
-    st.session_state.history.insert(0, {
-        "question": question,
-        "answer": answer
-    })
-    
-    # 清除 session_state 中的 question，避免下次自动填充
-    if "question" in st.session_state:
-        del st.session_state.question
+    # 答案区预留一个占位容器，加载动画和结果写进同一个节点，前端只重绘一次
+    placeholder = st.empty()
 
-# 显示历史记录
-if "history" in st.session_state and st.session_state.history:
-    st.markdown("---")
-    st.subheader("📜 最近提问")
-    for i, h in enumerate(st.session_state.history[:5]):
-        with st.expander(f"Q{i+1}: {h['question'][:30]}..."):
-            st.write(h['answer'])
+    # 处理提问（纯空白输入直接拦下，不发起查询）
+    q = question.strip()
+    if ask_button and q:
+        # 规整后作缓存键，空白差异不产生重复缓存项
+        q_norm = re.sub(r'\s+', '', q)
+        with placeholder.container():
+            with st.spinner("🔍 正在查询知识图谱..."):
+                answer = _cached_answer(q_norm)
+
+        # 保存到历史记录（deque 头插 O(1)，maxlen 自动裁掉旧记录）
+        if "history" not in st.session_state:
+            st.session_state.history = collections.deque(maxlen=5)
+        st.session_state.history.appendleft({
+            "question": q,
+            "answer": answer
+        })
+
+        # 回答存入会话状态后整页重跑一次：本片段外的历史区才能看到新记录
+        st.session_state.last_answer = answer
+        st.rerun(scope="app")
+
+    # 最近一次回答从会话状态渲染，整页重跑后仍然可见
+    if "last_answer" in st.session_state:
+        answer = st.session_state.last_answer
+        with placeholder.container():
+            st.markdown("### 📝 回答")
+            m = _ROUTE.search(answer)
+            (_ROUTERS[m.lastindex - 1] if m else st.success)(answer)
+
+
+# 历史记录同样独立成 fragment
+@st.fragment
+def history_fragment():
+    if "history" in st.session_state and st.session_state.history:
+        st.markdown("---")
+        st.subheader("📜 最近提问")
+        for i, h in enumerate(st.session_state.history):
+            # 容器 key 按问题内容哈希，历史没变化的重跑可以复用前端组件；
+            # 加上序号防止重复提问撞 key
+            qkey = hashlib.blake2b(h['question'].encode(), digest_size=8).hexdigest()
+            with st.container(key=f"hist_{i}_{qkey}"):
+                with st.expander(f"Q{i+1}: {h['question'][:30]}..."):
+                    st.write(h['answer'])
+
+
+qa_fragment()
+history_fragment()
 
 # 页脚
 st.markdown("---")